@@ -355,7 +355,7 @@ def enter_thumbnail(thumbnail):
 
 @bdd.then(bdd.parsers.parse("the thumbnail number {number:d} should be selected"))
 def check_selected_thumbnail(thumbnail, qtbot, number):
-    assert thumbnail.currentRow() + 1 == number
+    assert thumbnail.current_index() + 1 == number
 
 
 @bdd.then(bdd.parsers.parse("the pop up '{title}' should be displayed"))
@@ -5,11 +5,11 @@
 # License: GNU GPL v3, see the "LICENSE" and "AUTHORS" files for details.
 
 import contextlib
-import imghdr
 
 import pytest_bdd as bdd
 
 from vimiv import plugins
+from vimiv.utils import files
 
 
 bdd.scenarios("plugins.feature")
@@ -22,7 +22,7 @@ def load_plugin(name, info):
 
 @bdd.then(bdd.parsers.parse("The {name} format should be supported"))
 def check_format_supported(name):
-    for func in imghdr.tests:
+    for func in files._tests:
         with contextlib.suppress(IndexError):
             format_name = func.__name__.split("_")[-1]
             if format_name == name:
@@ -38,3 +38,9 @@ Feature: Display status information in the statusbar
         Given I start vimiv
         When I run set read_only true
         Then the left status should include [RO]
+
+    Scenario: Show thumbnail name and extension in statusbar
+        Given I open 3 images
+        When I enter thumbnail mode
+        And I run set statusbar.left_thumbnail {thumbnail-name} {thumbnail-extension}
+        Then the left status should include image_01 jpg
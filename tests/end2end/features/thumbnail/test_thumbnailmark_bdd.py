@@ -12,5 +12,5 @@ bdd.scenarios("thumbnailmark.feature")
 
 @bdd.then(bdd.parsers.parse("the thumbnail number {number:d} should be marked"))
 def check_thumbnail_marked(thumbnail, number):
-    item = thumbnail.item(number - 1)
-    assert item is not None and item.marked
+    model = thumbnail.model()
+    assert model.is_marked(model.index(number - 1))
@@ -7,6 +7,7 @@ Feature: Zoom thumbnails.
     Scenario: Increase thumbnail size.
         When I run zoom in
         Then the thumbnail size should be 256
+        And the center status should include large
 
     Scenario: Decrease thumbnail size.
         When I run zoom out
@@ -66,3 +66,19 @@ def test_partial_matches_with_multiple_special_keys():
     match = bindings.match(("<ctrl>", "<alt>"))
     assert match.is_partial_match
     assert list(match.partial) == list(bindings_dict.items())
+
+
+@pytest.mark.parametrize("mode", api.modes.GLOBALS)
+def test_get_global_binding_without_merging(mode):
+    binding, command = "t1", "test"
+    api.keybindings.bind(binding, command, api.modes.GLOBAL)
+    bindings = api.keybindings.get(mode)
+    assert bindings is api.keybindings._registry[mode]
+    assert bindings[binding].value == command
+
+
+def test_register_returns_function_unchanged():
+    def test():
+        """Nop function to register a keybinding."""
+
+    assert api.keybindings.register("t1", "test", mode=api.modes.IMAGE)(test) is test
@@ -151,3 +151,15 @@ def test_ask_prompt_setting(mocker, prompt_setting, answer):
     mocker.patch("vimiv.api.prompt.ask_question", ask_question)
 
     assert bool(prompt_setting) == answer
+
+
+def test_clamp_int_setting_of_setting_type():
+    i = settings.IntSetting("int", 1, max_value=10)
+    i.value = 20
+    assert i.value == 10
+
+
+def test_fail_convert_setting_message():
+    i = settings.IntSetting("int", 1)
+    with pytest.raises(ValueError, match="Cannot convert 'any' to Integer"):
+        i.value = "any"
@@ -32,3 +32,17 @@ def test_text_non_whitespace_with_non_whitespace(text):
         assert stripped_text == text.strip()
 
     function(text)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("command", ("", "command", [])),
+        ("2command", ("2", "command", [])),
+        ("42command arg", ("42", "command", ["arg"])),
+        ("command2 arg", ("", "command2", ["arg"])),
+        ("123", ("123", "", [])),
+    ],
+)
+def test_parse(text, expected):
+    assert runners._parse(text) == expected
@@ -78,6 +78,26 @@ def test_fail_get_nonexisting_style_option(new_style):
     styles._style = None
 
 
+@pytest.fixture
+def clear_get_cache():
+    """Fixture to clear the cache of styles.get before and after the test."""
+    styles.get.cache_clear()
+    yield
+    styles.get.cache_clear()
+
+
+@pytest.mark.usefixtures("clear_get_cache")
+def test_get_cached_until_parsed(mocker, new_style):
+    mocker.patch.object(styles, "_style", new_style)
+    mocker.patch.object(styles, "create_default", return_value=new_style)
+    expected = new_style["image.bg"]
+    assert styles.get("image.bg") == expected
+    new_style["image.bg"] = "#123456"
+    assert styles.get("image.bg") == expected
+    styles.parse()
+    assert styles.get("image.bg") == "#123456"
+
+
 def test_is_color_option():
     assert styles.Style.is_color_option("test.bg")
     assert styles.Style.is_color_option("test.fg")
@@ -169,3 +189,29 @@ def check_critical_error_handling(path):
 @pytest.mark.parametrize("name", ("name", "{name}"))
 def test_style_key(name):
     assert styles.Style.key(name) == "{name}"
+
+
+def test_apply_caches_dereferenced_stylesheet(mocker, new_style):
+    mocker.patch.object(styles, "_style", new_style)
+    mocker.patch.object(styles, "_sheets", {})
+    obj = mocker.Mock(STYLESHEET="color: {image.bg};")
+    expected = f"color: {new_style['image.bg']};"
+    styles.apply(obj)
+    obj.setStyleSheet.assert_called_once_with(expected)
+    assert styles._sheets == {obj.STYLESHEET: expected}
+
+
+def test_apply_keeps_unknown_options_and_blocks(mocker, new_style):
+    mocker.patch.object(styles, "_style", new_style)
+    mocker.patch.object(styles, "_sheets", {})
+    obj = mocker.Mock(STYLESHEET="QWidget {\n    color: {image.bg} {unknown};\n}")
+    styles.apply(obj)
+    expected = f"QWidget {{\n    color: {new_style['image.bg']} {{unknown}};\n}}"
+    obj.setStyleSheet.assert_called_once_with(expected)
+
+
+def test_dump_style_with_percent(mocker, tmp_path, new_style):
+    mocker.patch.object(styles, "abspath", return_value=str(tmp_path / "style"))
+    new_style["font"] = "100% Monospace"
+    styles.dump("style", new_style)
+    assert "font = 100% Monospace" in (tmp_path / "style").read_text()
@@ -0,0 +1,32 @@
+# vim: ft=python fileencoding=utf-8 sw=4 et sts=4
+
+# This file is part of vimiv.
+# Copyright 2017-2021 Christian Karl (karlch) <karlch at protonmail dot com>
+# License: GNU GPL v3, see the "LICENSE" and "AUTHORS" files for details.
+
+"""Tests for vimiv.gui.library."""
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QStandardItemModel
+
+import pytest
+
+from vimiv.gui.library import SizeItem
+
+
+@pytest.fixture()
+def model(mocker):
+    """Fixture to retrieve a model with a single size item."""
+    model = QStandardItemModel()
+    model.appendRow((SizeItem("path", mocker.Mock(return_value="1.0K")),))
+    yield model
+
+
+def test_size_item_not_retrieved_before_displayed(model):
+    model.item(0)._get_size.assert_not_called()
+
+
+def test_size_item_retrieved_once(model):
+    for _ in range(3):
+        assert model.data(model.index(0, 0), Qt.DisplayRole) == "1.0K"
+    model.item(0)._get_size.assert_called_once_with("path")
@@ -6,25 +6,34 @@
 
 """Tests for vimiv.gui.thumbnail."""
 
-from PyQt5.QtCore import QSize
+from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QIcon
 
 import pytest
 
-from vimiv.gui.thumbnail import ThumbnailItem
+from vimiv.gui.thumbnail import ThumbnailModel
 
 
 @pytest.fixture()
-def item(mocker):
-    """Fixture to retrieve a vanilla ThumbnailItem."""
-    ThumbnailItem._default_icon = None
-    mocker.patch.object(ThumbnailItem, "create_default_icon", return_value=QIcon())
-    yield ThumbnailItem
+def model(mocker):
+    """Fixture to retrieve a vanilla ThumbnailModel."""
+    ThumbnailModel._default_icon = None
+    mocker.patch.object(ThumbnailModel, "create_default_icon", return_value=QIcon())
+    yield ThumbnailModel()
 
 
-def test_create_default_pixmap_once(item):
+def test_create_default_pixmap_once(model):
     """Ensure the default thumbnail icon is only created once."""
-    size_hint = QSize(128, 128)
-    for index in range(5):
-        item(None, index, size_hint=size_hint)
-    item.create_default_icon.assert_called_once()
+    model.set_paths([f"image_{i:02d}.jpg" for i in range(5)])
+    for row in range(model.rowCount()):
+        model.data(model.index(row), Qt.DecorationRole)
+    model.create_default_icon.assert_called_once()
+
+
+def test_keep_created_icons_of_remaining_paths(model):
+    """Ensure thumbnails of paths that are kept are not lost when updating paths."""
+    model.set_paths(["a", "b", "c"])
+    icon = QIcon()
+    model.set_icon(1, icon)
+    model.set_paths(["b", "c"])
+    assert model._icons == {"b": icon}
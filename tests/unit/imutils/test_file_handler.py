@@ -0,0 +1,33 @@
+# vim: ft=python fileencoding=utf-8 sw=4 et sts=4
+
+# This file is part of vimiv.
+# Copyright 2017-2021 Christian Karl (karlch) <karlch at protonmail dot com>
+# License: GNU GPL v3, see the "LICENSE" and "AUTHORS" files for details.
+
+"""Tests for vimiv.imutils._file_handler."""
+
+from PyQt5.QtGui import QPixmap
+
+import pytest
+
+from vimiv.imutils import _file_handler
+
+
+@pytest.fixture(autouse=True)
+def mock_exif(mocker):
+    """Fixture to disable copying exif information to the written file."""
+    yield mocker.patch("vimiv.imutils.exif.ExifHandler")
+
+
+def test_write_image(qtbot, tmp_path):
+    path = tmp_path / "image.png"
+    _file_handler._write(QPixmap(10, 10), str(path), "original.png")
+    assert path.is_file()
+
+
+def test_write_rejects_invalid_image(mocker, tmp_path):
+    path = tmp_path / "image.jpg"
+    pixmap = mocker.Mock()  # Saving does not write anything to the file
+    with pytest.raises(_file_handler.WriteError, match="No valid image written"):
+        _file_handler._write(pixmap, str(path), "original.jpg")
+    assert not path.exists()
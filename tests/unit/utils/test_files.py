@@ -7,27 +7,28 @@
 """Tests for vimiv.utils.files."""
 
 import collections
-import imghdr
 import os
 import tarfile
 
+from PyQt5.QtCore import QByteArray
 from PyQt5.QtGui import QImageReader
 
 import pytest
 
-from vimiv.utils import files
+from vimiv.utils import files, imagereader
 
 
 SUPPORTED_IMAGE_FORMATS = ["jpg", "png", "gif", "svg", "cr2"]
 
 
 @pytest.fixture()
-def mockimghdr(mocker):
-    """Fixture to mock imghdr.tests and QImageReader supportedImageFormats."""
-    mocker.patch.object(
-        QImageReader, "supportedImageFormats", return_value=SUPPORTED_IMAGE_FORMATS
-    )
-    yield mocker.patch("imghdr.tests", [])
+def mock_format_tests(mocker):
+    """Fixture to mock the format tests and QImageReader supportedImageFormats."""
+    qt_formats = [QByteArray(name.encode()) for name in SUPPORTED_IMAGE_FORMATS]
+    mocker.patch.object(QImageReader, "supportedImageFormats", return_value=qt_formats)
+    imagereader.qt_formats.cache_clear()
+    yield mocker.patch.object(files, "_tests", [])
+    imagereader.qt_formats.cache_clear()
 
 
 @pytest.fixture()
@@ -116,12 +117,46 @@ def test_directories_supported(mocker):
 def test_images_supported(mocker):
     mocker.patch("os.path.isdir", return_value=False)
     mocker.patch("os.path.isfile", return_value=True)
-    mocker.patch("imghdr.what", return_value=True)
+    mocker.patch.object(files, "_is_image_file", return_value=True)
     images, directories = files.supported(["a", "b"])
     assert images == ["a", "b"]
     assert not directories
 
 
+@pytest.fixture()
+def supported_directory(tmp_path):
+    """Fixture to create a directory with images, directories and other files."""
+    for name in ("b.jpg", "a.jpg", ".hidden.jpg"):
+        tmp_path.joinpath(name).write_bytes(b"\xff\xd8\xff\xe0\x00\x10JFIF\x00")
+    for name in ("sub", ".hiddensub"):
+        tmp_path.joinpath(name).mkdir()
+    tmp_path.joinpath("text.txt").write_text("not an image")
+    yield str(tmp_path)
+
+
+@pytest.mark.parametrize("show_hidden", (True, False))
+@pytest.mark.parametrize("threads", (1, 2))
+def test_scan_supported(supported_directory, show_hidden, threads):
+    expected = files.supported(files.listdir(supported_directory, show_hidden))
+    result = files.scan_supported(supported_directory, show_hidden, threads)
+    assert result == expected
+
+
+def test_scan_supported_content(supported_directory):
+    images, directories = files.scan_supported(supported_directory)
+    expected_images = [os.path.join(supported_directory, f) for f in ("a.jpg", "b.jpg")]
+    assert images == expected_images
+    assert directories == [os.path.join(supported_directory, "sub")]
+
+
+def test_scan_supported_without_checking_file_type(mocker, supported_directory):
+    isfile = mocker.spy(os.path, "isfile")
+    isdir = mocker.spy(os.path, "isdir")
+    files.scan_supported(supported_directory)
+    isfile.assert_not_called()
+    isdir.assert_not_called()
+
+
 def test_tar_gz_not_an_image(tmp_path):
     """Test if is_image for a tar.gz returns False.
 
@@ -136,6 +171,54 @@ def test_tar_gz_not_an_image(tmp_path):
     assert files.is_image(str(tarpath)) is False
 
 
+@pytest.mark.parametrize(
+    "header",
+    (
+        b"\xff\xd8\xff\xdb",
+        b"\x00\x00\x00\x00\x00\x00JFIF",
+        b"\x00\x00\x00\x00\x00\x00Exif",
+        b"\x89PNG\r\n\x1a\n",
+        b"GIF87a",
+        b"GIF89a",
+    ),
+)
+def test_is_image_from_magic_bytes(mock_format_tests, tmp_path, header):
+    path = tmp_path / "image"
+    path.write_bytes(header)
+    assert files.is_image(str(path))
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    (
+        (b"\x00\x00\x00\x00\x00\x00JFIF", "jpg"),
+        (b"\x00\x00\x00\x00\x00\x00Exif", "jpg"),
+        (b"\xff\xd8\x00\x00\x00\x008BIM", "jpg"),
+        (b"\xff\xd8\xff\xe2ICC_PROFILE", None),
+        (b"\x00\x00JFIF", None),
+    ),
+)
+def test_jpg(header, expected):
+    assert files.test_jpg(header, None) == expected
+
+
+@pytest.mark.parametrize("name", ("image.jpg", "image.PNG", "image.cr2"))
+def test_is_image_from_extension(mock_format_tests, tmp_path, name):
+    path = tmp_path / name
+    path.touch()
+    assert files.is_image(str(path))
+
+
+@pytest.mark.parametrize("name", ("jpg", ".jpg", "image.txt"))
+def test_no_image_extension(mock_format_tests, name):
+    assert files.image_extension(name) is None
+
+
+def test_is_image_passes_open_file_to_tests(mock_format_tests, tmpfile):
+    files.add_image_format("svg", lambda _h, f: f is not None and f.name == tmpfile)
+    assert files.is_image(tmpfile)
+
+
 def test_is_image_on_error(tmp_path):
     path = tmp_path / "my_file"
     path.touch(mode=0o000)
@@ -149,7 +232,18 @@ def test_is_image_on_fifo_file(qtbot, tmp_path):
 
 
 @pytest.mark.parametrize(
-    "size, expected", [(510, "510B"), (2048, "2.0K"), (3 * 1024 ** 8, "3.0Y")]
+    "size, expected",
+    [
+        (0, "0.0B"),
+        (510, "510B"),
+        (1023, "1023B"),
+        (1024, "1.0K"),
+        (2048, "2.0K"),
+        (1024 ** 2 - 1, "1024K"),
+        (150.5 * 1024 ** 3, "150G"),
+        (3 * 1024 ** 8, "3.0Y"),
+        (2048 * 1024 ** 8, "2048.0Y"),
+    ],
 )
 def test_sizeof_fmt(size, expected):
     assert files.sizeof_fmt(size) == expected
@@ -157,6 +251,7 @@ def test_sizeof_fmt(size, expected):
 
 def test_get_size_directory_with_directories(mocker):
     paths = [str(i) for i in range(15)]
+    mocker.patch("os.stat")
     mocker.patch("os.listdir", return_value=paths)
     mocker.patch("os.path.isdir", return_value=True)
     mocker.patch("os.path.isfile", return_value=False)
@@ -165,33 +260,67 @@ def test_get_size_directory_with_directories(mocker):
 
 def test_get_size_directory_with_images(mocker):
     paths = [str(i) for i in range(10)]
+    mocker.patch("os.stat")
     mocker.patch("os.listdir", return_value=paths)
     mocker.patch("os.path.isdir", return_value=False)
     mocker.patch.object(files, "is_image", return_value=True)
     assert files.get_size_directory("any") == "10"
 
 
+def test_get_size_directory_cached_until_modified(tmp_path):
+    directory = str(tmp_path)
+    mtime_ns = os.stat(directory).st_mtime_ns
+    assert files.get_size_directory(directory) == "0"
+    tmp_path.joinpath("file").touch()
+    os.utime(directory, ns=(mtime_ns, mtime_ns))
+    assert files.get_size_directory(directory) == "0"
+    os.utime(directory, ns=(mtime_ns + 1, mtime_ns + 1))
+    assert files.get_size_directory(directory) == "1"
+
+
 def test_get_size_with_permission_error(mocker):
-    mocker.patch("os.path.isfile", side_effect=PermissionError)
+    mocker.patch("os.stat", side_effect=PermissionError)
     assert files.get_size("any") == "N/A"
 
 
+def test_get_size_of_file(tmp_path):
+    path = tmp_path / "file"
+    path.write_bytes(bytes(2048))
+    assert files.get_size(str(path)) == "2.0K"
+
+
+def test_get_size_of_directory(directory_tree):
+    assert files.get_size(str(directory_tree.root)) == "4"
+
+
 def test_listfiles(directory_tree):
     expected = sorted(directory_tree.files)
     assert expected == sorted(files.listfiles(str(directory_tree.root)))
 
 
+def test_listfiles_abspath(directory_tree):
+    root = str(directory_tree.root)
+    expected = sorted(os.path.join(root, path) for path in directory_tree.files)
+    assert expected == sorted(files.listfiles(root, abspath=True))
+
+
+def test_listfiles_does_not_follow_symlinks(directory_tree):
+    directory_tree.root.joinpath("link").symlink_to(directory_tree.root / "sub0")
+    expected = sorted(directory_tree.files)
+    assert expected == sorted(files.listfiles(str(directory_tree.root)))
+
+
 @pytest.mark.parametrize("name", SUPPORTED_IMAGE_FORMATS)
-def test_add_supported_format(mockimghdr, tmpfile, name):
+def test_add_supported_format(mock_format_tests, tmpfile, name):
     files.add_image_format(name, _test_dummy)
-    assert mockimghdr, "No test added by add image format"
-    assert imghdr.what(tmpfile) == name
+    assert mock_format_tests, "No test added by add image format"
+    assert files.image_format(tmpfile) == name
 
 
-def test_add_unsupported_format(mockimghdr, tmpfile):
+def test_add_unsupported_format(mock_format_tests, tmpfile):
     files.add_image_format("not_a_format", _test_dummy)
-    assert imghdr.what(tmpfile) is None
-    assert not mockimghdr, "Unsupported test not removed"
+    assert files.image_format(tmpfile) is None
+    assert not mock_format_tests, "Unsupported test not removed"
 
 
 def _test_dummy(h, f):
@@ -94,6 +94,12 @@ def test_contains_nomatch(trie):
     assert "abcd" not in trie
 
 
+def test_getitem_raises_keyerror_with_full_path(trie):
+    trie["abc"] = "value"
+    with pytest.raises(KeyError, match="abd"):
+        trie["abd"]  # pylint: disable=pointless-statement
+
+
 def test_delitem_destroys_empty_nodes(trie):
     key = "abc"
     trie[key] = "value"
@@ -161,6 +161,13 @@ def test_slot(type_hint):
     assert dummy.value == 42
 
 
+def test_slot_returns_function_unwrapped():
+    def test(x: int):
+        ...
+
+    assert utils.slot(test) is test
+
+
 def test_slot_ignore_self():
     def test(self, name: str):
         ...
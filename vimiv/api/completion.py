@@ -77,10 +77,13 @@ def get_model(text: str, mode: modes.Mode) -> "BaseModel":
     """
     best_match, best_match_size = cast(BaseModel, None), -1
     for required_text, model in _models.items():
-        if mode in model.modes:
-            match_size = len(required_text)
-            if text.startswith(required_text) and len(required_text) > best_match_size:
-                best_match, best_match_size = model, match_size
+        match_size = len(required_text)
+        if (
+            match_size > best_match_size
+            and mode in model.modes
+            and text.startswith(required_text)
+        ):
+            best_match, best_match_size = model, match_size
     _logger.debug("Model '%s' for text '%s'", best_match, text)
     return best_match
 
@@ -35,7 +35,7 @@ earth with ``ge`` we could use::
 
 import functools
 import re
-from typing import Callable, Union, Tuple, Iterable, Iterator
+from typing import Callable, Union, Tuple, Iterable, Iterator, Optional
 
 from vimiv.api import commands, modes
 from vimiv.utils import customtypes, trie
@@ -70,11 +70,12 @@ def bind(
 
     See config/configcommands.bind for the corresponding command.
     """
+    keys = _BindingsTrie.keysequence(keybinding)
     for submode in modes.GLOBALS if mode is modes.GLOBAL else (mode,):
         bindings = _registry[submode]
-        if not override and keybinding in bindings:
+        if not override and keys in bindings:
             raise ValueError(f"Duplicate keybinding for '{keybinding}'")
-        bindings[keybinding] = command
+        bindings[keys] = command
 
 
 def unbind(keybinding: str, mode: modes.Mode) -> None:
@@ -82,9 +83,10 @@ def unbind(keybinding: str, mode: modes.Mode) -> None:
 
     See config/configcommands.unbind for the corresponding command.
     """
+    keys = _BindingsTrie.keysequence(keybinding)
     for submode in modes.GLOBALS if mode is modes.GLOBAL else (mode,):
         try:
-            del _registry[submode][keybinding]
+            del _registry[submode][keys]
         except KeyError:
             raise commands.CommandError(f"No binding found for '{keybinding}'")
 
@@ -94,13 +96,16 @@ class _BindingsTrie(trie.Trie):
 
     SPECIAL_KEY_RE = re.compile("<.*?>")
 
-    def __setitem__(self, keybinding: str, command: str) -> None:  # type: ignore
-        super().__setitem__(self.keysequence(keybinding), command)
+    def __setitem__(self, keybinding: Iterable[str], command: str) -> None:
+        if isinstance(keybinding, str):
+            super().__setitem__(self.keysequence(keybinding), command)
+        else:
+            super().__setitem__(keybinding, command)
 
-    def __getitem__(self, keybinding: Iterable[str]) -> trie.Trie:
+    def _find(self, keybinding: Iterable[str]) -> Optional[trie.Trie]:
         if isinstance(keybinding, str):
-            return super().__getitem__(self.keysequence(keybinding))
-        return super().__getitem__(keybinding)
+            return super()._find(self.keysequence(keybinding))
+        return super()._find(keybinding)
 
     def __delitem__(self, keybinding: Iterable[str]) -> None:
         if isinstance(keybinding, str):
@@ -131,7 +136,11 @@ _registry = {mode: _BindingsTrie() for mode in modes.ALL}
 
 
 def get(mode: modes.Mode) -> trie.Trie:
-    """Return the keybindings of one specific mode."""
+    """Return the keybindings of one specific mode.
+
+    Global bindings are stored in each of the global modes upon binding, the returned
+    trie therefore already contains them and no merging is required.
+    """
     return _registry[mode]
 
 
@@ -141,8 +150,8 @@ def items() -> Iterator[Tuple[modes.Mode, Iterable[Tuple[str, str]]]]:
     Bindings that are in the global modes will be associated with the global mode. All
     remaining bindings are part of their respective mode.
     """
-    global_bindings = (
-        set(get(modes.IMAGE)) & set(get(modes.LIBRARY)) & set(get(modes.THUMBNAIL))
+    global_bindings = set(get(modes.IMAGE)).intersection(
+        get(modes.LIBRARY), get(modes.THUMBNAIL)
     )
 
     def sort(bindings: Iterable[Tuple[str, str]]) -> Iterable[Tuple[str, str]]:
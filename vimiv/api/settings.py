@@ -11,7 +11,6 @@ Module attributes:
 """
 
 import abc
-import contextlib
 import enum
 from typing import Any, Dict, ItemsView, List
 
@@ -130,12 +129,18 @@ class Setting(QObject, metaclass=AbstractQObjectMeta):
         return self._suggestions
 
     def convert(self, value: Any) -> Any:
-        """Convert value to setting type before using it."""
-        with contextlib.suppress(ValueError):  # Re-raise later with consistent message
+        """Convert value to setting type before using it.
+
+        Values that already are of the setting type are returned directly.
+        """
+        if type(value) is self.typ:  # pylint: disable=unidiomatic-typecheck
+            return value
+        try:
             if isinstance(value, str):
                 return self.convertstr(value)
             return self.typ(value)
-        raise ValueError(f"Cannot convert '{value}' to {self}")
+        except ValueError:  # Re-raise with consistent message
+            raise ValueError(f"Cannot convert '{value}' to {self}") from None
 
     def convertstr(self, value: str) -> Any:
         return self.typ(value)
@@ -330,6 +335,14 @@ startup_library = BoolSetting(
     hidden=True,
 )
 style = StrSetting("style", "default", hidden=True)
+scan_threads = IntSetting(
+    "scan_threads",
+    1,
+    desc="Number of threads used to check files when reading a directory, "
+    "useful for network filesystems",
+    min_value=1,
+    hidden=True,
+)
 read_only = BoolSetting(
     "read_only", False, desc="Disable any commands that are able to edit files on disk"
 )
@@ -223,8 +223,8 @@ class WorkingDirectoryHandler(QFileSystemWatcher):
             directories: List of directories inside the directory.
         """
         show_hidden = settings.library.show_hidden.value
-        paths = files.listdir(directory, show_hidden=show_hidden)
-        return files.supported(paths)
+        threads = settings.scan_threads.value
+        return files.scan_supported(directory, show_hidden=show_hidden, threads=threads)
 
 
 handler = cast(WorkingDirectoryHandler, None)
@@ -13,6 +13,7 @@ Module Attributes:
 """
 
 import os
+import re
 import shlex
 from typing import Dict, List, NamedTuple, Tuple
 
@@ -24,6 +25,7 @@ SEPARATOR = "&&"
 external_runner = external.ExternalRunner()
 
 _last_command: Dict[api.modes.Mode, "LastCommand"] = {}
+_COUNT_RE = re.compile(r"\d*")
 _logger = log.module_logger(__name__)
 
 
@@ -182,13 +184,11 @@ def _parse(text: str) -> Tuple[str, str, List[str]]:
         args: Arguments passed.
     """
     text = text.strip()
-    count = ""
     split = shlex.split(text)
     cmdname = split[0]
     # Receive prepended digits as count
-    while cmdname and cmdname[0].isdigit():
-        count += cmdname[0]
-        cmdname = cmdname[1:]
+    end = _COUNT_RE.match(cmdname).end()  # type: ignore[union-attr]
+    count, cmdname = cmdname[:end], cmdname[end:]
     args = split[1:]
     return count, cmdname, args
 
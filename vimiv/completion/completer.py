@@ -80,7 +80,7 @@ class Completer(QObject):
             text: Text in the commandline which defines the model.
         """
         model = api.completion.get_model(text, api.modes.COMMAND.last)
-        if model != self.model:
+        if model is not self.model:
             model.on_enter(text)
             self.proxy_model.setSourceModel(model)
             self._completion.update_column_widths()
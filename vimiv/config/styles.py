@@ -13,13 +13,16 @@ Module Attributes:
 
     _style: Dictionary saving the style settings from the config file, form:
         _style["image.bg"] = "#000000"
+    _sheets: Dictionary caching the dereferenced stylesheets, form:
+        _sheets[raw_stylesheet] = dereferenced_stylesheet
 """
 
 import configparser
+import functools
 import os
 import re
 import sys
-from typing import cast
+from typing import Dict, Match, cast
 
 from vimiv import api
 from vimiv.config import read_log_exception, external_configparser, _style_options
@@ -31,6 +34,8 @@ NAME_DEFAULT_DARK = "default-dark"
 DEFAULT_FONT = "10pt Monospace"
 
 _style = cast("Style", None)
+_sheets: Dict[str, str] = {}
+_OPTION_RE = re.compile(r"{[^{}\s]+}")
 _logger = log.module_logger(__name__)
 
 
@@ -41,8 +46,13 @@ class Style(dict):
 
     A python dictionary with a name and overridden __setitem__ for convenience.
     Ordered so referencing and dereferencing variables is well defined.
+
+    Class Attributes:
+        COLOR_RE: Regular expression matching valid html colors.
     """
 
+    COLOR_RE = re.compile(r"#([0-9a-f]{6}|[0-9a-f]{8})")
+
     def __init__(self, *colors: str, font: str = DEFAULT_FONT):
         """Initialize style with 16 colors for base 16 and a font."""
         super().__init__()
@@ -73,12 +83,11 @@ class Style(dict):
         assert isinstance(name, str), "Style options must be strings."
         assert isinstance(item, str), "Style values must be strings."
         key = self.key(name)
-        if item in self:
-            super().__setitem__(key, self[item])
-        else:
-            if self.is_color_option(key):
-                self.check_valid_color(item)
-            super().__setitem__(key, item)
+        if item in self:  # Dereference variable, item is already a valid key
+            item = super().__getitem__(item)
+        elif self.is_color_option(key):
+            self.check_valid_color(item)
+        super().__setitem__(key, item)
 
     @classmethod
     def key(cls, name: str):
@@ -90,8 +99,8 @@ class Style(dict):
         """Return True if the style option name corresponds to a color."""
         return name.strip("{}").endswith((".fg", ".bg", ".color"))
 
-    @staticmethod
-    def check_valid_color(color: str):
+    @classmethod
+    def check_valid_color(cls, color: str):
         """Check if a color string is a valid html color.
 
         Accepts strings that start with # and have 6 (#RRGGBB) or 8 (#AARRGGBB) hex
@@ -100,7 +109,7 @@ class Style(dict):
         Raises:
             ValueError if the string is invalid.
         """
-        if not re.fullmatch(r"#([0-9a-f]{6}|[0-9a-f]{8})", color.lower()):
+        if not cls.COLOR_RE.fullmatch(color.lower()):
             raise ValueError(
                 f"{color} is not a valid html color. "
                 "Supported formats are #RRGGBB and #AARRGGBB."
@@ -129,6 +138,8 @@ def parse():
     name = api.settings.style.value
     _logger.debug("Parsing style '%s'", name)
     filename = abspath(name)
+    _sheets.clear()
+    get.cache_clear()
     if name == NAME_DEFAULT:
         _style = create_default()
     elif name == NAME_DEFAULT_DARK:
@@ -147,14 +158,26 @@ def apply(obj, append: str = ""):
         obj: The QObject to apply the stylesheet to.
         append: Extra string to append to the stylesheet.
     """
-    sheet = obj.STYLESHEET + append
-    for option, value in _style.items():
-        sheet = sheet.replace(option, value)
+    raw = obj.STYLESHEET + append
+    try:
+        sheet = _sheets[raw]
+    except KeyError:
+        sheet = _sheets[raw] = _OPTION_RE.sub(_dereference, raw)
     obj.setStyleSheet(sheet)
 
 
+def _dereference(match: Match) -> str:
+    """Return the style value of an option matched in a stylesheet if it exists."""
+    option = match.group()
+    return _style.get(option, option)
+
+
+@functools.lru_cache(None)
 def get(name: str) -> str:
-    """Return style option for a given name."""
+    """Return style option for a given name.
+
+    The result is cached until the style is parsed again.
+    """
     try:
         return _style[f"{{{name}}}"]
     except KeyError:
@@ -243,7 +266,7 @@ def read(path: str) -> Style:
     except ValueError as e:
         _crash_read(path, str(e))
     # Override additional options
-    for option, value in parser["STYLE"].items():
+    for option, value in section.items():
         _logger.debug("Overriding '%s' with '%s'", option, value)
         try:
             style[option] = value
@@ -259,7 +282,7 @@ def dump(name: str, style: Style):
     filename = abspath(name)
     xdg.makedirs(os.path.dirname(filename))
     _logger.debug("Dumping style to file '%s'", filename)
-    parser = configparser.ConfigParser()
+    parser = configparser.ConfigParser(interpolation=None)
     parser.add_section("STYLE")
     for option, value in style.items():
         option = option.strip("{}")
@@ -9,7 +9,7 @@
 import contextlib
 import math
 import os
-from typing import List, Optional, Dict, NamedTuple
+from typing import Any, Callable, List, Optional, Dict, NamedTuple
 
 from PyQt5.QtCore import Qt, pyqtSlot
 from PyQt5.QtWidgets import QStyledItemDelegate, QSizePolicy, QStyle
@@ -473,12 +473,37 @@ class LibraryModel(QStandardItemModel):
                 name = utils.add_html(name + "/", "b")
             if path in api.mark.paths:
                 name = mark_prefix + name
-            with contextlib.suppress(FileNotFoundError):  # Deleted in the meantime
-                size = get_size(path)
-                self.appendRow(
-                    (QStandardItem(str(i)), QStandardItem(name), QStandardItem(size))
-                )
-                self.paths.append(path)
+            self.appendRow(
+                (QStandardItem(str(i)), QStandardItem(name), SizeItem(path, get_size))
+            )
+            self.paths.append(path)
+
+
+class SizeItem(QStandardItem):
+    """Item displaying the size of a path.
+
+    The size is only retrieved once the item is displayed, as this requires reading
+    from disk and only few of all paths in a directory are usually shown.
+
+    Attributes:
+        _path: Path to retrieve the size of.
+        _get_size: Function returning the formatted size of the path.
+        _size: The formatted size once retrieved, None before.
+    """
+
+    def __init__(self, path: str, get_size: Callable[[str], str]):
+        super().__init__()
+        self._path = path
+        self._get_size = get_size
+        self._size: Optional[str] = None
+
+    def data(self, role: int = Qt.UserRole + 1) -> Any:
+        """Return the size for the display role, retrieving it on first access."""
+        if role != Qt.DisplayRole:
+            return super().data(role)
+        if self._size is None:
+            self._size = self._get_size(self._path)
+        return self._size
 
 
 class LibraryDelegate(QStyledItemDelegate):
@@ -9,10 +9,10 @@
 import contextlib
 import math
 import os
-from typing import List, Optional, Iterator, cast
+from typing import Dict, List, Optional, Set
 
-from PyQt5.QtCore import Qt, QSize, QRect, pyqtSlot
-from PyQt5.QtWidgets import QListWidget, QListWidgetItem, QStyle, QStyledItemDelegate
+from PyQt5.QtCore import Qt, QSize, QRect, QModelIndex, QAbstractListModel, pyqtSlot
+from PyQt5.QtWidgets import QListView, QStyle, QStyledItemDelegate
 from PyQt5.QtGui import QColor, QIcon
 
 from vimiv import api, utils, imutils, widgets
@@ -23,12 +23,12 @@ from vimiv.utils import create_pixmap, thumbnail_manager, log
 
 
 _logger = log.module_logger(__name__)
-
-
-# The class is certainly very border-line in size, much like the corresponding classes
-# image.ScrollableImage and library.Library.
-# TODO consider refactoring if this improves code-clarity
-# pylint: disable=too-many-public-methods
+_SIZE_NAMES = dict(
+    zip(
+        api.settings.ThumbnailSizeSetting.ALLOWED_VALUES,
+        ("small", "normal", "large", "x-large"),
+    )
+)
 
 
 class ThumbnailView(
@@ -36,42 +36,45 @@ class ThumbnailView(
     widgets.GetNumVisibleMixin,
     widgets.ScrollToCenterMixin,
     widgets.ScrollWheelCumulativeMixin,
-    QListWidget,
+    QListView,
 ):
     """Thumbnail widget.
 
     Attributes:
+        padding: Padding around each thumbnail in pixels.
+
         _manager: ThumbnailManager class to create thumbnails asynchronously.
-        _paths: Last paths loaded to avoid duplicate loading.
+        _model: ThumbnailModel storing the paths and created thumbnails.
+        _scrollbar_width: Width of the scrollbar in pixels.
     """
 
     STYLESHEET = """
-    QListWidget {
+    QListView {
         font: {thumbnail.font};
         background-color: {thumbnail.bg};
     }
 
-    QListWidget::item {
+    QListView::item {
         padding: {thumbnail.padding}px;
     }
 
-    QListWidget::item:selected {
+    QListView::item:selected {
         background: {thumbnail.selected.bg};
     }
 
-    QListWidget QScrollBar {
+    QListView QScrollBar {
         width: {library.scrollbar.width};
         background: {library.scrollbar.bg};
     }
 
-    QListWidget QScrollBar::handle {
+    QListView QScrollBar::handle {
         background: {library.scrollbar.fg};
         border: {library.scrollbar.padding} solid
                 {library.scrollbar.bg};
         min-height: 10px;
     }
 
-    QListWidget QScrollBar::sub-line, QScrollBar::add-line {
+    QListView QScrollBar::sub-line, QScrollBar::add-line {
         border: none;
         background: none;
     }
@@ -81,9 +84,14 @@ class ThumbnailView(
     @api.objreg.register
     def __init__(self):
         widgets.ScrollWheelCumulativeMixin.__init__(self, self._scroll_wheel_callback)
-        QListWidget.__init__(self)
+        QListView.__init__(self)
 
-        self._paths: List[str] = []
+        self._model = ThumbnailModel()
+        self.setModel(self._model)
+        self.padding = int(styles.get("thumbnail.padding").replace("px", ""))
+        self._scrollbar_width = int(
+            styles.get("image.scrollbar.width").replace("px", "")
+        )
 
         fail_pixmap = create_pixmap(
             color=styles.get("thumbnail.error.bg"),
@@ -94,10 +102,11 @@ class ThumbnailView(
         self._manager = thumbnail_manager.ThumbnailManager(fail_pixmap)
 
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.setViewMode(QListWidget.IconMode)
+        self.setViewMode(QListView.IconMode)
         default_size = api.settings.thumbnail.size.value
         self.setIconSize(QSize(default_size, default_size))
-        self.setResizeMode(QListWidget.Adjust)
+        self.setResizeMode(QListView.Adjust)
+        self.setUniformItemSizes(True)
 
         self.setItemDelegate(ThumbnailDelegate(self))
         self.setDragEnabled(False)
@@ -107,24 +116,17 @@ class ThumbnailView(
         api.signals.new_images_opened.connect(self._on_new_images_opened)
         api.settings.thumbnail.size.changed.connect(self._on_size_changed)
         search.search.new_search.connect(self._on_new_search)
-        search.search.cleared.connect(self._on_search_cleared)
-        self._manager.created.connect(self._on_thumbnail_created)
+        self._manager.created.connect(self._model.set_icon)
         self.activated.connect(self.open_selected)
         self.doubleClicked.connect(self.open_selected)
-        api.mark.marked.connect(self._mark_highlight)
-        api.mark.unmarked.connect(lambda path: self._mark_highlight(path, marked=False))
         api.mark.markdone.connect(self.repaint)
         synchronize.signals.new_library_path_selected.connect(self._select_path)
 
         styles.apply(self)
 
-    def __iter__(self) -> Iterator["ThumbnailItem"]:
-        for index in range(self.count()):
-            yield self.item(index)
-
     def current_index(self) -> int:
         """Return the index of the currently selected item."""
-        return self.currentRow()
+        return self.currentIndex().row()
 
     def current_column(self) -> int:
         """Return the column of the currently selected item."""
@@ -136,20 +138,19 @@ class ThumbnailView(
 
     def n_columns(self) -> int:
         """Return the number of columns."""
-        sb_width = int(styles.get("image.scrollbar.width").replace("px", ""))
-        return (self.width() - sb_width) // self.item_size()
+        return (self.width() - self._scrollbar_width) // self.item_size()
 
     def n_rows(self) -> int:
         """Return the number of rows."""
         return math.ceil(self.count() / self.n_columns())
 
-    def item(self, index: int) -> "ThumbnailItem":
-        return cast(ThumbnailItem, super().item(index))
+    def count(self) -> int:
+        """Return the number of thumbnails."""
+        return self._model.rowCount()
 
     def clear(self):
-        """Override clear to also empty paths."""
-        self._paths = []
-        super().clear()
+        """Remove all thumbnails."""
+        self._model.set_paths([])
 
     @pyqtSlot(list)
     def _on_new_images_opened(self, paths: List[str]):
@@ -158,78 +159,30 @@ class ThumbnailView(
         Args:
             paths: List of new paths to load.
         """
-        if paths == self._paths:  # Nothing to do
+        if paths == self._model.paths:  # Nothing to do
             _logger.debug("No new images to load")
             return
         _logger.debug("Updating thumbnails...")
-        removed = set(self._paths) - set(paths)
-        for path in removed:
-            _logger.debug("Removing existing thumbnail '%s'", path)
-            idx = self._paths.index(path)
-            del self._paths[idx]  # Remove as the index also changes in the QListWidget
-            if not self.takeItem(idx):
-                _logger.error("Error removing thumbnail for '%s'", path)
-        size_hint = QSize(self.item_size(), self.item_size())
-        for i, path in enumerate(paths):
-            if path not in self._paths:  # Add new path
-                _logger.debug("Adding new thumbnail '%s'", path)
-                ThumbnailItem(self, i, size_hint=size_hint)
-            self.item(i).marked = path in api.mark.paths  # Ensure correct highlighting
-        self._paths = paths
+        current = self.current()
+        self._model.set_paths(paths)
+        self._select_path(current)  # Resetting the model clears the selection
         self._manager.create_thumbnails_async(paths)
         _logger.debug("... update completed")
 
-    @utils.slot
-    def _on_thumbnail_created(self, index: int, icon: QIcon):
-        """Insert created thumbnail as soon as manager created it.
-
-        Args:
-            index: Index of the created thumbnail as integer.
-            icon: QIcon to insert.
-        """
-        item = self.item(index)
-        if item is not None:  # Otherwise it has been deleted in the meanwhile
-            item.setIcon(icon)
-
     @pyqtSlot(int, list, api.modes.Mode, bool)
     def _on_new_search(
-        self, index: int, matches: List[str], mode: api.modes.Mode, _incremental: bool
+        self, index: int, _matches: List[str], mode: api.modes.Mode, _incremental: bool
     ):
         """Select search result after new search.
 
         Args:
             index: Index to select.
-            matches: List of all matches of the search.
+            _matches: List of all matches of the search.
             mode: Mode for which the search was performed.
             _incremental: True if incremental search was performed.
         """
-        if self._paths and mode == api.modes.THUMBNAIL:
+        if self._model.paths and mode == api.modes.THUMBNAIL:
             self._select_index(index)
-            for item, path in zip(self, self._paths):
-                item.highlighted = os.path.basename(path) in matches
-            self.repaint()
-
-    @utils.slot
-    def _on_search_cleared(self):
-        """Reset highlighted and force repaint when search results cleared."""
-        for item in self:
-            item.highlighted = False
-        self.repaint()
-
-    def _mark_highlight(self, path: str, marked: bool = True):
-        """(Un-)Highlight a path if it was (un-)marked.
-
-        Args:
-            path: The (un-)marked path.
-            marked: True if it was marked.
-        """
-        try:
-            index = self._paths.index(path)
-        except ValueError:
-            _logger.debug("Ignoring mark as thumbnails have not been created")
-            return
-        item = self.item(index)
-        item.marked = marked
 
     @api.commands.register(mode=api.modes.THUMBNAIL)
     def open_selected(self):
@@ -348,76 +301,57 @@ class ThumbnailView(
         _logger.debug("Zooming in direction '%s'", direction)
         api.settings.thumbnail.size.step(up=direction == direction.In)
 
-    def rescale_items(self):
-        """Reset item hint when item size has changed."""
-        for i in range(self.count()):
-            item = self.item(i)
-            item.setSizeHint(QSize(self.item_size(), self.item_size()))
-        self.scrollTo(self.currentIndex())
-
     @utils.slot
     def _select_path(self, path: str):
         """Select a specific path by name."""
         with contextlib.suppress(ValueError):
-            self._select_index(self._paths.index(path), emit=False)
+            self._select_index(self._model.paths.index(path), emit=False)
 
     def _select_index(self, index: int, emit: bool = True) -> None:
-        """Select specific item in the ListWidget.
+        """Select specific item in the ListView.
 
         Args:
             index: Number of the current item to select.
             emit: Emit the new_thumbnail_path_selected signal.
         """
-        if not self._paths:
+        if not self._model.paths:
             raise api.commands.CommandWarning("Thumbnail list is empty")
         _logger.debug("Selecting thumbnail number %d", index)
         index = utils.clamp(index, 0, self.count() - 1)
-        self.setCurrentRow(index)
+        self.setCurrentIndex(self._model.index(index))
         if emit:
-            synchronize.signals.new_thumbnail_path_selected.emit(self._paths[index])
+            synchronize.signals.new_thumbnail_path_selected.emit(
+                self._model.paths[index]
+            )
 
     def _on_size_changed(self, value: int):
         _logger.debug("Setting size to %d", value)
         self.setIconSize(QSize(value, value))
-        self.rescale_items()
+        self.scrollTo(self.currentIndex())
 
     def item_size(self):
         """Return the size of one icon including padding."""
-        padding = int(styles.get("thumbnail.padding").replace("px", ""))
-        return self.iconSize().width() + 2 * padding
+        return self.iconSize().width() + 2 * self.padding
 
     @api.status.module("{thumbnail-basename}")
     def _thumbnail_basename(self):
         """Basename of the currently selected thumbnail."""
-        try:
-            abspath = self._paths[self.current_index()]
-            basename = os.path.basename(abspath)
-            return basename
-        except IndexError:
-            return ""
+        return os.path.basename(self.current())
 
     @api.status.module("{thumbnail-name}")
     def _thumbnail_name(self):
         """Name without extension of the currently selected thumbnail."""
-        try:
-            name, _ = os.path.splitext(self._thumbnail_basename())
-            return name
-        except IndexError:
-            return ""
+        return os.path.splitext(self._thumbnail_basename())[0]
 
     @api.status.module("{thumbnail-extension}")
     def _thumbnail_extension(self):
         """Extension of the currently selected thumbnail."""
-        try:
-            _, extension = os.path.splitext(self._thumbnail_basename())
-            return extension.replace(".", "")
-        except IndexError:
-            return ""
+        return os.path.splitext(self._thumbnail_basename())[1][1:]
 
     def current(self):
         """Current path for thumbnail mode."""
         try:
-            return self._paths[self.current_index()]
+            return self._model.paths[self.current_index()]
         except IndexError:
             return ""
 
@@ -429,8 +363,7 @@ class ThumbnailView(
     @api.status.module("{thumbnail-size}")
     def size(self):
         """Current thumbnail size (small/normal/large/x-large)."""
-        sizes = {64: "small", 128: "normal", 256: "large", 512: "x-large"}
-        return sizes[self.iconSize().width()]
+        return _SIZE_NAMES[self.iconSize().width()]
 
     @api.status.module("{thumbnail-index}")
     def current_index_statusbar(self) -> str:
@@ -440,7 +373,7 @@ class ThumbnailView(
     @api.status.module("{thumbnail-total}")
     def total(self):
         """Total number of thumbnails."""
-        return str(self.model().rowCount())
+        return str(self.count())
 
     def resizeEvent(self, event):
         """Update resize event to keep selected thumbnail centered."""
@@ -474,7 +407,6 @@ class ThumbnailDelegate(QStyledItemDelegate):
         self.selection_bg_unfocus = QColor(styles.get("thumbnail.selected.bg.unfocus"))
         self.search_bg = QColor(styles.get("thumbnail.search.highlighted.bg"))
         self.mark_bg = QColor(styles.get("mark.color"))
-        self.padding = int(styles.get("thumbnail.padding"))
 
     def paint(self, painter, option, model_index):
         """Override the QStyledItemDelegate paint function.
@@ -484,11 +416,15 @@ class ThumbnailDelegate(QStyledItemDelegate):
             option: The QStyleOptionViewItem.
             model_index: The QModelIndex.
         """
-        item = self.parent().item(model_index.row())
-        self._draw_background(painter, option, item)
-        self._draw_pixmap(painter, option, item)
+        self._draw_background(painter, option, model_index)
+        self._draw_pixmap(painter, option, model_index)
+
+    def sizeHint(self, _option, _model_index):
+        """Return the size of one thumbnail including padding."""
+        size = self.parent().item_size()
+        return QSize(size, size)
 
-    def _draw_background(self, painter, option, item):
+    def _draw_background(self, painter, option, model_index):
         """Draw the background rectangle of the thumbnail.
 
         The color depends on whether the item is selected and on whether it is
@@ -497,16 +433,16 @@ class ThumbnailDelegate(QStyledItemDelegate):
         Args:
             painter: The QPainter.
             option: The QStyleOptionViewItem.
-            item: The ThumbnailItem.
+            model_index: The QModelIndex.
         """
-        color = self._get_background_color(item, option.state)
+        color = self._get_background_color(model_index, option.state)
         painter.save()
         painter.setBrush(color)
         painter.setPen(Qt.NoPen)
         painter.drawRect(option.rect)
         painter.restore()
 
-    def _draw_pixmap(self, painter, option, item):
+    def _draw_pixmap(self, painter, option, model_index):
         """Draw the actual pixmap of the thumbnail.
 
         This calculates the size of the pixmap, applies padding and
@@ -515,29 +451,30 @@ class ThumbnailDelegate(QStyledItemDelegate):
         Args:
             painter: The QPainter.
             option: The QStyleOptionViewItem.
-            item: The ThumbnailItem.
+            model_index: The QModelIndex.
         """
+        padding = self.parent().padding
         painter.save()
         # Original thumbnail pixmap
-        pixmap = item.icon().pixmap(256)
+        pixmap = model_index.data(Qt.DecorationRole).pixmap(256)
         # Rectangle that can be filled by the pixmap
         rect = QRect(
-            option.rect.x() + self.padding,
-            option.rect.y() + self.padding,
-            option.rect.width() - 2 * self.padding,
-            option.rect.height() - 2 * self.padding,
+            option.rect.x() + padding,
+            option.rect.y() + padding,
+            option.rect.width() - 2 * padding,
+            option.rect.height() - 2 * padding,
         )
         # Size the pixmap should take
         size = pixmap.size().scaled(rect.size(), Qt.KeepAspectRatio)
         # Coordinates to center the pixmap
         diff_x = (rect.width() - size.width()) / 2.0
         diff_y = (rect.height() - size.height()) / 2.0
-        x = int(option.rect.x() + self.padding + diff_x)
-        y = int(option.rect.y() + self.padding + diff_y)
+        x = int(option.rect.x() + padding + diff_x)
+        y = int(option.rect.y() + padding + diff_y)
         # Draw
         painter.drawPixmap(x, y, size.width(), size.height(), pixmap)
         painter.restore()
-        if item.marked:
+        if model_index.model().is_marked(model_index):
             self._draw_mark(painter, option, x + size.width(), y + size.height())
 
     def _draw_mark(self, painter, option, x, y):
@@ -551,41 +488,136 @@ class ThumbnailDelegate(QStyledItemDelegate):
         """
         # Try to set 5 % of width, reduce to padding if this is smaller
         # At least 4px width
-        width = int(max(min(0.05 * option.rect.width(), self.padding), 4))
+        width = int(max(min(0.05 * option.rect.width(), self.parent().padding), 4))
         painter.save()
         painter.setBrush(self.mark_bg)
         painter.setPen(Qt.NoPen)
         painter.drawRect(x - width // 2, y - width // 2, width, width)
         painter.restore()
 
-    def _get_background_color(self, item, state):
+    def _get_background_color(self, model_index, state):
         """Return the background color of an item.
 
         The color depends on selected and highlighted as search result.
 
         Args:
-            item: The ThumbnailItem storing highlight status.
+            model_index: The QModelIndex indicating highlighted.
             state: State of the model index indicating selected.
         """
         if state & QStyle.State_Selected:
             if api.modes.current() == api.modes.THUMBNAIL:
                 return self.selection_bg
             return self.selection_bg_unfocus
-        if item.highlighted:
+        if model_index.model().is_highlighted(model_index):
             return self.search_bg
         return self.bg
 
 
-class ThumbnailItem(QListWidgetItem):
-    """Item storing a single thumbnail and it's search and mark status."""
+class ThumbnailModel(QAbstractListModel):
+    """Model used for the thumbnail widget.
+
+    Rows are only indices into the list of paths. Icons are created lazily when the
+    view requests them, falling back to a shared default icon until the thumbnail
+    manager created the actual thumbnail.
+
+    Attributes:
+        paths: List of paths for which thumbnails are displayed.
+
+        _highlighted: Set of paths that are highlighted as search results.
+        _icons: Dictionary mapping paths to the created thumbnail icons.
+    """
 
     _default_icon = None
 
-    def __init__(self, parent, index, *, size_hint, highlighted=False, marked=False):
-        super().__init__(self.default_icon(), "", parent, index)
-        self.highlighted = highlighted
-        self.marked = marked
-        self.setSizeHint(size_hint)
+    def __init__(self):
+        super().__init__()
+        self.paths: List[str] = []
+        self._highlighted: Set[str] = set()
+        self._icons: Dict[str, QIcon] = {}
+        search.search.new_search.connect(self._on_new_search)
+        search.search.cleared.connect(self._on_search_cleared)
+        api.mark.marked.connect(self._on_mark_changed)
+        api.mark.unmarked.connect(self._on_mark_changed)
+
+    def rowCount(self, parent=QModelIndex()):  # pylint: disable=unused-argument
+        """Return the number of thumbnails."""
+        return len(self.paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the thumbnail icon for the decoration role."""
+        if role == Qt.DecorationRole:
+            icon = self._icons.get(self.paths[index.row()])
+            return icon if icon is not None else self.default_icon()
+        return None
+
+    def set_paths(self, paths: List[str]):
+        """Reset the model to display thumbnails for paths.
+
+        Thumbnails that were created for paths which are kept remain valid.
+        """
+        self.beginResetModel()
+        self._icons = {path: self._icons[path] for path in paths if path in self._icons}
+        self.paths = paths
+        self.endResetModel()
+
+    @utils.slot
+    def set_icon(self, index: int, icon: QIcon):
+        """Insert created thumbnail as soon as manager created it.
+
+        Args:
+            index: Index of the created thumbnail as integer.
+            icon: QIcon to insert.
+        """
+        if index < len(self.paths):  # Otherwise it has been deleted in the meanwhile
+            self._icons[self.paths[index]] = icon
+            model_index = self.index(index)
+            self.dataChanged.emit(model_index, model_index, [Qt.DecorationRole])
+
+    def is_highlighted(self, index):
+        """Return True if the index is highlighted as search result."""
+        return self.paths[index.row()] in self._highlighted
+
+    def is_marked(self, index):
+        """Return True if the path corresponding to index is marked."""
+        return api.mark.is_marked(self.paths[index.row()])
+
+    @pyqtSlot(int, list, api.modes.Mode, bool)
+    def _on_new_search(
+        self, _index: int, matches: List[str], mode: api.modes.Mode, _incremental: bool
+    ):
+        """Store set of paths to highlight on new search.
+
+        Args:
+            _index: Index to select.
+            matches: List of all matches of the search.
+            mode: Mode for which the search was performed.
+            _incremental: True if incremental search was performed.
+        """
+        if mode == api.modes.THUMBNAIL:
+            self._highlighted = {
+                path for path in self.paths if os.path.basename(path) in matches
+            }
+            self._update_all()
+
+    @utils.slot
+    def _on_search_cleared(self):
+        """Reset highlighted when the search results were cleared."""
+        self._highlighted = set()
+        self._update_all()
+
+    def _on_mark_changed(self, path: str):
+        """Update the thumbnail of a path if it was (un-)marked."""
+        try:
+            model_index = self.index(self.paths.index(path))
+        except ValueError:
+            _logger.debug("Ignoring mark as thumbnails have not been created")
+            return
+        self.dataChanged.emit(model_index, model_index)
+
+    def _update_all(self):
+        """Notify views that all thumbnails need to be redrawn."""
+        if self.paths:
+            self.dataChanged.emit(self.index(0), self.index(len(self.paths) - 1))
 
     @classmethod
     def default_icon(cls):
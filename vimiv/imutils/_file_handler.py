@@ -219,7 +219,12 @@ def _write(pixmap, path, original_path):
     # Check if valid image was created
     if not os.path.isfile(path):
         raise WriteError("File not written, unknown exception")
-    if not files.is_image(path):
+    # Check the header as the extension alone does not ensure the image is valid
+    try:
+        file_format = files.image_format(path)
+    except OSError:
+        file_format = None
+    if file_format is None:
         os.remove(path)
         raise WriteError("No valid image written. Is the extention valid?")
 
@@ -195,7 +195,8 @@ def slot(function: FuncT) -> FuncT:
     """Annotation based slot decorator using pyqtSlot.
 
     Syntactic sugar for pyqtSlot so the parameter types do not have to be repeated when
-    there are type annotations.
+    there are type annotations. The annotations are only evaluated once at decoration
+    time and the function itself is returned, i.e. there is no additional wrapper.
 
     Example:
         @slot
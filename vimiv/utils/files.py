@@ -6,18 +6,33 @@
 
 """Functions dealing with files and paths."""
 
+import concurrent.futures
+import contextlib
 import imghdr
 import functools
+import itertools
+import operator
 import os
-from typing import List, Tuple, Optional, BinaryIO, Iterable, Callable
-
-from PyQt5.QtGui import QImageReader
+import stat
+from typing import List, Tuple, Optional, BinaryIO, Iterable, Iterator, Callable
 
 from vimiv.utils import imagereader
 
 
 ImghdrTestFuncT = Callable[[bytes, Optional[BinaryIO]], bool]
 
+_SIZE_UNITS = ("B", "K", "M", "G", "T", "P", "E", "Z")
+
+# Magic bytes and their offset of formats that are always supported
+_MAGIC_BYTES = (
+    (b"\xff\xd8", 0),  # jpg
+    (b"JFIF", 6),  # jpg
+    (b"Exif", 6),  # jpg
+    (b"\x89PNG\r\n\x1a\n", 0),  # png
+    (b"GIF87a", 0),  # gif
+    (b"GIF89a", 0),  # gif
+)
+
 
 def listdir(directory: str, show_hidden: bool = False) -> List[str]:
     """Wrapper around os.listdir.
@@ -29,11 +44,13 @@ def listdir(directory: str, show_hidden: bool = False) -> List[str]:
         Sorted list of files in the directory with their absolute path.
     """
     directory = os.path.abspath(os.path.expanduser(directory))
-    return sorted(
-        os.path.join(directory, path)
-        for path in os.listdir(directory)
-        if show_hidden or not path.startswith(".")
-    )
+    prefix = os.path.join(directory, "")
+    # Sorting the names gives the same order as sorting the full paths, only faster
+    names = os.listdir(directory)
+    if not show_hidden:
+        names = [name for name in names if name[0] != "."]
+    names.sort()
+    return [prefix + name for name in names]
 
 
 def supported(paths: Iterable[str]) -> Tuple[List[str], List[str]]:
@@ -55,6 +72,43 @@ def supported(paths: Iterable[str]) -> Tuple[List[str], List[str]]:
     return images, directories
 
 
+def scan_supported(
+    directory: str, show_hidden: bool = False, threads: int = 1
+) -> Tuple[List[str], List[str]]:
+    """Get a list of supported images and a list of directories in directory.
+
+    Equivalent to supported(listdir(directory)), but re-uses the file type information
+    of os.scandir instead of retrieving it again for every path.
+
+    Args:
+        directory: Directory to scan for images and directories.
+        show_hidden: Include hidden files in output.
+        threads: Number of threads used to check the files for images in parallel.
+    Returns:
+        images: Sorted list of images inside the directory.
+        directories: Sorted list of directories inside the directory.
+    """
+    directory = os.path.abspath(os.path.expanduser(directory))
+    with os.scandir(directory) as it:
+        entries = list(it)
+    if not show_hidden:
+        entries = [entry for entry in entries if entry.name[0] != "."]
+    entries.sort(key=operator.attrgetter("name"))
+    directories = []
+    candidates = []
+    for entry in entries:
+        if entry.is_dir():
+            directories.append(entry.path)
+        elif entry.is_file():
+            candidates.append(entry.path)
+    if 1 < threads < len(candidates):
+        with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+            checks = list(executor.map(_is_image_file, candidates))
+    else:
+        checks = list(map(_is_image_file, candidates))
+    return list(itertools.compress(candidates, checks)), directories
+
+
 def get_size(path: str) -> str:
     """Get the size of a path in human readable format.
 
@@ -66,12 +120,12 @@ def get_size(path: str) -> str:
         Size of path as string.
     """
     try:
-        isfile = os.path.isfile(path)
+        stat_result = os.stat(path)
+        if stat.S_ISREG(stat_result.st_mode):
+            return sizeof_fmt(stat_result.st_size)
+        return _get_size_directory(path, stat_result.st_mtime_ns)
     except OSError:
         return "N/A"
-    if isfile:
-        return get_size_file(path)
-    return get_size_directory(path)
 
 
 def get_size_file(path: str) -> str:
@@ -91,13 +145,15 @@ def sizeof_fmt(num: float) -> str:
     Returns:
         Filesize in human-readable format.
     """
-    for unit in ("B", "K", "M", "G", "T", "P", "E", "Z"):
-        if num < 1024.0:
-            if num < 100:
-                return f"{num:3.1f}{unit}"
-            return f"{num:3.0f}{unit}"
-        num /= 1024.0
-    return f"{num:.1f}Y"
+    # Each unit covers 10 bits, the largest one is Y which may exceed 1024
+    exponent = max(0, (int(num).bit_length() - 1) // 10)
+    if exponent >= len(_SIZE_UNITS):
+        return f"{num / (1 << 10 * len(_SIZE_UNITS)):.1f}Y"
+    num /= 1 << 10 * exponent
+    unit = _SIZE_UNITS[exponent]
+    if num < 100:
+        return f"{num:3.1f}{unit}"
+    return f"{num:3.0f}{unit}"
 
 
 def get_size_directory(path: str) -> str:
@@ -109,11 +165,21 @@ def get_size_directory(path: str) -> str:
         Size as formatted string.
     """
     try:
-        return str(len(os.listdir(path)))
+        return _get_size_directory(path, os.stat(path).st_mtime_ns)
     except OSError:
         return "N/A"
 
 
+@functools.lru_cache(4096)
+def _get_size_directory(path: str, _mtime_ns: int) -> str:
+    """Helper to cache the size of a directory until its modification time changes.
+
+    Any change of the directory content, i.e. files added or removed, updates the
+    modification time of the directory and thus invalidates the cached value.
+    """
+    return str(len(os.listdir(path)))
+
+
 def is_image(filename: str) -> bool:
     """Check whether a file is an image.
 
@@ -121,11 +187,69 @@ def is_image(filename: str) -> bool:
         filename: Name of file to check.
     """
     try:
-        return os.path.isfile(filename) and imghdr.what(filename) is not None
+        return os.path.isfile(filename) and _is_image_file(filename)
     except OSError:
         return False
 
 
+def _is_image_file(filename: str) -> bool:
+    """Check whether a file that is known to be a regular file is an image.
+
+    Files with the extension of a supported format are considered images without
+    reading them, all others are identified by their header.
+
+    Args:
+        filename: Name of file to check.
+    """
+    if image_extension(filename) is not None:
+        return True
+    try:
+        with open(filename, "rb") as f:
+            header = f.read(32)
+            if any(header.startswith(*magic) for magic in _MAGIC_BYTES):
+                return True
+            return _image_format(header, f) is not None
+    except OSError:
+        return False
+
+
+def image_extension(filename: str) -> Optional[str]:
+    """Return the extension of a file if it is the name of a supported image format.
+
+    Args:
+        filename: Name of file to check.
+    """
+    extension = os.path.splitext(filename)[1][1:].lower()
+    if (
+        extension in imagereader.qt_formats()
+        or extension in imagereader.external_handler
+    ):
+        return extension
+    return None
+
+
+def image_format(filename: str) -> Optional[str]:
+    """Return the image format of a file or None if it is not a supported image.
+
+    Args:
+        filename: Name of file to check.
+    Raises:
+        OSError if the file cannot be read.
+    """
+    with open(filename, "rb") as f:
+        return _image_format(f.read(32), f)
+
+
+def _image_format(header: bytes, f: BinaryIO) -> Optional[str]:
+    """Return the image format given the header and the open file, None if unknown."""
+    # Copy as tests of unsupported formats remove themselves from the list
+    for test in tuple(_tests):
+        file_format = test(header, f)
+        if file_format:
+            return file_format
+    return None
+
+
 def listfiles(directory: str, abspath: bool = False) -> List[str]:
     """Return list of all files in directory traversing the directory recursively.
 
@@ -133,13 +257,28 @@ def listfiles(directory: str, abspath: bool = False) -> List[str]:
         directory: The directory to traverse.
         abspath: Return the absolute path to the files, not relative to directory.
     """
-    return [
-        os.path.join(root, fname)
-        if abspath
-        else os.path.join(root.replace(directory, "").lstrip("/"), fname)
-        for root, _, files in os.walk(directory)
-        for fname in files
-    ]
+    prefix = os.path.join(directory, "") if abspath else ""
+    return list(_walk_files(directory, prefix))
+
+
+def _walk_files(directory: str, prefix: str) -> Iterator[str]:
+    """Yield all files in directory recursively prepended by prefix.
+
+    Equivalent to os.walk without following symbolic links, but the prefix of the
+    files is extended once per directory instead of joining the path of every file.
+    """
+    stack = [(directory, prefix)]
+    while stack:
+        root, root_prefix = stack.pop()
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        yield root_prefix + entry.name
+                    elif not entry.is_symlink():
+                        stack.append((entry.path, root_prefix + entry.name + os.sep))
+        except OSError:
+            continue
 
 
 def add_image_format(name: str, check: ImghdrTestFuncT) -> None:
@@ -155,47 +294,50 @@ def add_image_format(name: str, check: ImghdrTestFuncT) -> None:
         if check(h, f):
             if hasattr(test, "checked"):
                 return name
-            if (
-                name in QImageReader.supportedImageFormats()
-                or name in imagereader.external_handler
-            ):
+            if name in imagereader.qt_formats() or name in imagereader.external_handler:
                 setattr(test, "checked", True)
                 return name
-            imghdr.tests.remove(test)
+            with contextlib.suppress(ValueError):  # Removed by another thread
+                _tests.remove(test)
         return None
 
-    imghdr.tests.insert(add_image_format.index, test)  # type: ignore
+    _tests.insert(add_image_format.index, test)  # type: ignore
     add_image_format.index += 1  # type: ignore
 
 
 add_image_format.index = 3  # type: ignore  # Start inserting after jpg, png and gif
 
 
-def test_svg(h: bytes, _f: Optional[BinaryIO]) -> bool:
-    return h.startswith((b"<?xml", b"<svg"))
-
-
-add_image_format("svg", test_svg)
-
-
-# We now directly override the jpg part of imghdr as it has some known limitations
+# We use a custom jpg test as the one from imghdr has some known limitations
 # See e.g. https://bugs.python.org/issue16512
 def test_jpg(h: bytes, _f: Optional[BinaryIO]) -> Optional[str]:
     """Custom jpg test function.
 
     The one from the imghdr module fails with some jpgs that include ICC_PROFILE data.
     """
-    if h[6:10] in (b"JFIF", b"Exif"):
+    if h.startswith((b"JFIF", b"Exif"), 6):
         return "jpg"
-    if h[:2] == b"\xff\xd8" and (b"JFIF" in h or b"8BIM" in h):
+    if h.startswith(b"\xff\xd8") and (b"JFIF" in h or b"8BIM" in h):
         return "jpg"
     return None
 
 
 def test_jpg_fallback(h: bytes, _f: Optional[BinaryIO]) -> Optional[str]:
     """Fallback test for jpg files with no headers, only the two starting bits."""
-    return "jpg" if h[:2] == b"\xff\xd8" else None
+    return "jpg" if h.startswith(b"\xff\xd8") else None
 
 
-imghdr.tests[0] = test_jpg
-imghdr.tests.append(test_jpg_fallback)
+# Tests used to determine the image format in the order they are performed, based on
+# the ones of the imghdr module which itself is left untouched
+_tests: List[Callable[[bytes, Optional[BinaryIO]], Optional[str]]] = [
+    test_jpg,
+    *imghdr.tests[1:],
+    test_jpg_fallback,
+]
+
+
+def test_svg(h: bytes, _f: Optional[BinaryIO]) -> bool:
+    return h.startswith((b"<?xml", b"<svg"))
+
+
+add_image_format("svg", test_svg)
@@ -7,16 +7,28 @@
 """Image reader classes to read images from file to Qt objects."""
 
 import abc
-from typing import Dict, Callable
+import functools
+from typing import Dict, Callable, FrozenSet
 
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QImageReader, QPixmap, QImage
 
-from .files import imghdr
+from vimiv.utils import files
 
 external_handler: Dict[str, Callable[[str], QPixmap]] = {}
 
 
+@functools.lru_cache(None)
+def qt_formats() -> FrozenSet[str]:
+    """Return the names of all image formats supported by QImageReader.
+
+    The lru_cache is used as the supported formats do not change while running and
+    this is checked for every image that is read.
+    """
+    formats = QImageReader.supportedImageFormats()
+    return frozenset(bytes(fmt).decode() for fmt in formats)
+
+
 class BaseReader(abc.ABC):
     """Base class for image readers.
 
@@ -67,7 +79,7 @@ class QtReader(BaseReader):
 
     @classmethod
     def supports(cls, file_format: str) -> bool:
-        return file_format in QImageReader.supportedImageFormats()
+        return file_format in qt_formats()
 
     @property
     def is_animation(self) -> bool:
@@ -109,7 +121,7 @@ def get_reader(path: str) -> BaseReader:
     """Retrieve the appropriate image reader class for path."""
     error = ValueError(f"'{path}' cannot be read as image")
     try:
-        file_format = imghdr.what(path)
+        file_format = files.image_format(path) or files.image_extension(path)
     except OSError:
         raise error
     if file_format is None:
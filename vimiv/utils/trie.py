@@ -49,13 +49,14 @@ class Trie:
 
     def __getitem__(self, key: KeyT) -> "Trie":
         """Retrieve the node matching key from the trie."""
-        node = self
-        for elem in key:
-            node = node.children[elem]
+        node = self._find(key)
+        if node is None:
+            raise KeyError("".join(key))
         return node
 
     def __contains__(self, key: KeyT) -> bool:
-        return not self.match(key).is_no_match
+        """Return True if key matches any node in the trie fully or partially."""
+        return self._find(key) is not None
 
     def __iter__(self) -> IterResultT:
         """Iterate over all key, value pairs in the leaf nodes."""
@@ -95,14 +96,26 @@ class Trie:
             3) If the key maps to a node with children, the TrieMatch is filled with an
                iterator to the key, value pairs of all children.
         """
-        try:
-            node = self[key]
-        except KeyError:
+        node = self._find(key)
+        if node is None:
             return TrieMatch()
         if node.key is not None:
             return TrieMatch(value=node.value)
         return TrieMatch(partial=iter(node))
 
+    def _find(self, key: KeyT) -> Optional["Trie"]:
+        """Return the node matching key or None if there is no such node.
+
+        The trie is walked element by element, stopping at the first mismatch.
+        """
+        node = self
+        for elem in key:
+            child = node.children.get(elem)
+            if child is None:
+                return None
+            node = child
+        return node
+
     def _getnodes(self, key: KeyT) -> List["Trie"]:
         """Return all nodes that make up key.
 